@@ -3,8 +3,8 @@ from typing import Coroutine
 
 from .__about__ import __version__  # noqa: F401
 from ._core.loop import Loop as _Loop
-from ._primitives.timing import Time, Eternity, Instant, interval, delay,\
-    IntervalExceeded
+from ._primitives.timing import Time, Eternity, Instant, time, eternity,\
+    instant, interval, delay, IntervalExceeded  # noqa: F401
 from ._primitives.flag import Flag
 from ._primitives.locks import Lock
 from ._primitives.context import until, Scope, VolatileTaskClosed
@@ -50,10 +50,3 @@ def run(*activities: Coroutine, start: float = 0, till: float = None):
         activities = root(_activities=activities, _till=till),
     loop = _Loop(*activities, start=start)
     loop.run()
-
-
-# Time related singletons
-#########################
-time = Time()
-eternity = Eternity()
-instant = Instant()
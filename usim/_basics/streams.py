@@ -29,7 +29,7 @@ A channel cannot be used in an ``async with until(...):`` statement.
 """
 from collections import deque
 
-from typing import Generic, TypeVar, Dict, List, Deque,\
+from typing import Generic, TypeVar, List,\
     Union, AsyncIterable, Generator, Any
 
 from .._primitives.notification import postpone, Notification, NoSubscribers
@@ -50,14 +50,21 @@ class Channel(AsyncIterable, Generic[ST]):
     """
     Unbuffered stream that broadcasts every message to all consumers
     """
+    __slots__ = ('_tail', '_consumers', '_notification', '_closed')
+
     @property
     def closed(self):
         return self._closed
 
     def __init__(self):
         super().__init__()
-        self._consumer_buffers = {}  \
-            # type: Dict[Any, Union[List[ST], Deque[ST]]]
+        # Messages form a singly linked list of ``[item, next]`` nodes.
+        # The tail is always an empty placeholder: ``put`` fills it and
+        # links a fresh placeholder. Every consumer holds the placeholder
+        # of its next message, so nodes are freed as soon as the last
+        # consumer has moved past them - or immediately if there is none.
+        self._tail = [None, None]  # type: List[Any]
+        self._consumers = 0
         self._notification = Notification()
         self._closed = False
 
@@ -80,28 +87,30 @@ class Channel(AsyncIterable, Generic[ST]):
     def __await__(self) -> Generator[Any, None, ST]:
         if self._closed:
             raise StreamClosed(self)
-        sentinel = object()
-        self._consumer_buffers[sentinel] = buffer = []  # type: List[ST]
+        node = self._tail
+        self._consumers += 1
         try:
             yield from self._notification.__await__()
         finally:
-            del self._consumer_buffers[sentinel]
-        if not buffer and self._closed:
+            self._consumers -= 1
+        # a node is filled once it links to the next placeholder
+        if node[1] is None and self._closed:
             raise StreamClosed(self)
-        return buffer[0]  # noqa: B901
+        return node[0]  # noqa: B901
 
     async def __aiter__(self):
-        sentinel = object()
-        self._consumer_buffers[sentinel] = buffer = deque()  # type: Deque[ST]
+        node = self._tail
+        self._consumers += 1
         try:
             while True:
-                while buffer:
-                    yield buffer.popleft()
+                while node[1] is not None:
+                    item, node = node
+                    yield item
                 if self._closed:
                     break
                 await self._notification
         finally:
-            del self._consumer_buffers[sentinel]
+            self._consumers -= 1
 
     async def put(self, item: ST):
         r"""
@@ -112,20 +121,23 @@ class Channel(AsyncIterable, Generic[ST]):
         """
         if self._closed:
             raise StreamClosed(self)
-        for buffer in self._consumer_buffers.values():
-            buffer.append(item)
+        node = self._tail
+        node[0] = item
+        node[1] = self._tail = [None, None]
         self._notification.__awake_all__()
         await postpone()
 
     def __repr__(self):
         return f'<{self.__class__.__name__}, '\
-               f'consumers={len(self._consumer_buffers)}, closed={self._closed}>'
+               f'consumers={self._consumers}, closed={self._closed}>'
 
 
 class Queue(AsyncIterable, Generic[ST]):
     """
     Buffered stream that anycasts messages to individual consumers
     """
+    __slots__ = ('_buffer', '_notification', '_read_mutex', '_closed')
+
     @property
     def closed(self):
         return self._closed
@@ -1,8 +1,10 @@
 import operator
 from weakref import WeakSet
 
-from typing import Callable, Union, Any, Generic, TypeVar, Generator, Awaitable
+from typing import Callable, Union, Any, Generic, TypeVar, Generator, Awaitable,\
+    Coroutine
 
+from .._core.loop import Interrupt as CoreInterrupt
 from .._primitives.notification import postpone
 from .._primitives.condition import Condition
 
@@ -22,6 +24,11 @@ class AsyncComparison(Condition):
     supported. Like any :py:class:`~.Condition`, it can be used both
     in an asynchronous and boolean context.
     """
+    # listeners are tracked via weak references
+    __slots__ = (
+        '_condition', '_left', '_right', '_test', '_listening', '__weakref__'
+    )
+
     _operator_symbol = {
         operator.lt: '<',
         operator.le: '<=',
@@ -57,19 +64,29 @@ class AsyncComparison(Condition):
         self._condition = condition
         self._left = left
         self._right = right
+        # sources are only listened to once someone waits for a change
+        self._listening = False
         if isinstance(left, Tracked):
+            # the test runs on every change of a source, so it reads the
+            # raw values instead of going through the ``value`` property
             if isinstance(right, Tracked):
-                self._test = lambda: condition(left.value, right.value)
-                right.__add_listener__(self)
+                self._test = lambda: condition(left._value, right._value)
             else:
-                self._test = lambda: condition(left.value, right)
-            left.__add_listener__(self)
+                self._test = lambda: condition(left._value, right)
         else:
             raise TypeError(
                 "the left-hand-side in a %s must be of type %s" %
                 (self.__class__.__name__, Tracked.__name__)
             )
 
+    def __subscribe__(self, waiter: Coroutine, interrupt: CoreInterrupt):
+        if not self._listening:
+            self._listening = True
+            self._left.__add_listener__(self)
+            if isinstance(self._right, Tracked):
+                self._right.__add_listener__(self)
+        super().__subscribe__(waiter, interrupt)
+
     def __on_changed__(self):
         if self._test():
             self.__trigger__()
@@ -117,6 +134,8 @@ class Tracked(Generic[V]):
     Circumventing this to change a mutable ``value`` directly prevents
     :py:class:`~.Tracked` from detecting the change and triggering events.
     """
+    __slots__ = ('_value', '_listeners')
+
     @property
     def value(self) -> V:
         """The current value"""
@@ -132,10 +151,14 @@ class Tracked(Generic[V]):
 
     async def set(self, to: V):
         """Set the value"""
+        self.__set_value__(to)
+        await postpone()
+
+    def __set_value__(self, to: V):
+        """Set the value and notify listeners without postponing"""
         self._value = to
         for listener in list(self._listeners):
             listener.__on_changed__()
-        await postpone()
 
     # boolean operations producing an AsyncComparison
     def __lt__(self, other):
@@ -181,7 +204,7 @@ class Tracked(Generic[V]):
     def __pow__(self, power, modulo=None) -> 'Union[AsyncOperation[V], Awaitable]':
         if modulo is None:
             return AsyncOperation(self, operator.__pow__, power)
-        return self.set(pow(self.value, power, modulo))
+        return self.set(pow(self._value, power, modulo))
 
     def __lshift__(self, other) -> 'AsyncOperation[V]':
         return AsyncOperation(self, operator.__lshift__, other)
@@ -275,10 +298,10 @@ class AsyncOperation(Generic[V, RHS]):
         self._rhs = rhs
 
     def __await__(self) -> Generator[Any, None, None]:
+        # inlined ``await base.set(...)`` to avoid an intermediate coroutine
         base = self._base
-        yield from base.set(
-            self._operator(base.value, self._rhs)
-        ).__await__()
+        base.__set_value__(self._operator(base._value, self._rhs))
+        yield from postpone().__await__()
 
     def __str__(self):
         return f'{self._base} {self._operator_symbol[self._operator]} {self._rhs}'
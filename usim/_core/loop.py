@@ -93,7 +93,7 @@ class Loop:
 
         async def sleep():
             print('start')
-            await Hibernate()  # suspend execution indefinitely
+            await __HIBERNATE__  # suspend execution indefinitely
             print('awoken')    # only run if the coroutine is re-scheduled somehow
 
     The :py:class:`Loop` instance running in the current thread
@@ -115,7 +115,7 @@ class Loop:
             # awake current activity from sleep via a scheduled interrupt
             __LOOP_STATE__.LOOP.schedule(__LOOP_STATE__.LOOP.activity, delay=duration)
             try:
-                await Hibernate()
+                await __HIBERNATE__
             finally:
                 # revoke the interrupt on exit in case *another* interrupt occured
                 interrupt.revoke()
@@ -154,36 +154,39 @@ class Loop:
     def _run_events(self):
         r"""event loop core, processing all scheduled coroutines"""
         activations = self._activations
+        # bind methods once instead of looking them up for every activation
+        pop_activations = activations.pop
         while activations:
-            now, pending = activations.pop()
+            now, pending = pop_activations()
             self.time = now
             self.turn = 0
             self._pending = pending
+            pop_pending = pending.popleft
             while pending:
-                activation = pending.popleft()
-                if activation:
+                activation = pop_pending()
+                signal = activation.signal
+                # skip activations whose signal has been revoked - this runs
+                # for every activation, so avoid a Python-level ``__bool__`` call
+                if signal is None or not signal._revoked:
                     self.turn += 1
-                    self.activity = activation.target
-                    self._run_coroutine(activation.target, activation.signal)
+                    target = self.activity = activation.target
+                    # inlined event loop kernel, processing a single coroutine
+                    try:
+                        if signal is not None:
+                            reply = target.throw(signal)
+                        else:
+                            reply = target.send(None)
+                        assert (
+                            type(reply) is Hibernate
+                        ), '%s received %s but only supports the Hibernate command' % (
+                            self.__class__.__name__, reply
+                        )
+                    except StopIteration as err:
+                        if err.args:
+                            # async def ... return foo -> StopIteration.args == (foo,)
+                            raise ActivityLeak(target, signal, err.args[0]) from err
                     self.activity = None
 
-    def _run_coroutine(self, target: Coroutine, signal: BaseException = None):
-        r"""event loop kernel, processing a single coroutine"""
-        try:
-            if signal is not None:
-                reply = target.throw(signal)
-            else:
-                reply = target.send(None)
-            assert (
-                type(reply) is Hibernate
-            ), '%s received %s but only supports the Hibernate command' % (
-                self.__class__.__name__, reply
-            )
-        except StopIteration as err:
-            if err.args:
-                # async def ... return foo -> StopIteration.args == (foo,)
-                raise ActivityLeak(target, signal, err.args[0]) from err
-
     def schedule(
             self,
             target: Coroutine,
@@ -251,13 +254,10 @@ class Activation(object):
         self.target = target
         self.signal = signal
 
-    def __bool__(self) -> bool:
-        return self.signal is None or not self.signal._revoked
-
     def __repr__(self):
         return '<%s of %s%s%s>' % (
             self.__class__.__name__,
             self.target,
             '' if self.signal is None else ' via %s' % self.signal,
-            '' if self else ' (cancelled)'
+            '' if self.signal is None or self.signal else ' (cancelled)'
         )
@@ -1,3 +1,17 @@
+r"""
+Priority queues of activations, ordered by simulation time
+
+Activations are bucketed by their key: every distinct point in time
+holds a :py:class:`collections.deque` of items in insertion order.
+Only the first item for a key touches the underlying ordering;
+further items for the same key are plain appends.
+Popping yields an entire bucket, which the :py:class:`~usim._core.loop.Loop`
+processes as one time step.
+
+The implementation can be selected via the ``USIM_WAITQUEUE`` environment
+variable: by default, a heap of keys is used; ``USIM_WAITQUEUE=SD`` selects
+a :py:class:`sortedcontainers.SortedDict` instead.
+"""
 import os
 from typing import Generic, TypeVar, Tuple, Dict, List, Union, Type
 from heapq import heappush, heappop
@@ -24,12 +38,14 @@ class HQWaitQueue(Generic[K, V]):
         return sum(len(item) for item in self._data.values())
 
     def push(self, key: K, item: V):
-        try:
-            self._data[key].append(item)
-        except KeyError:
-            self._data[key] = elements = deque()  # type: deque[V]
-            elements.append(item)
+        # most pushes are for a new deadline – a lookup is cheaper than
+        # raising and handling a KeyError for each of them
+        elements = self._data.get(key)
+        if elements is None:
+            self._data[key] = deque((item,))
             heappush(self._keys, key)
+        else:
+            elements.append(item)
 
     def pop(self) -> 'Tuple[K, deque[V]]':
         key = heappop(self._keys)
@@ -55,10 +71,10 @@ class SDWaitQueue(Generic[K, V]):
         return sum(len(item) for item in self._data.values())
 
     def push(self, key: K, item: V):
-        try:
-            self._data[key].append(item)
-        except KeyError:
-            self._data[key] = elements = deque()  # type: deque[V]
+        elements = self._data.get(key)
+        if elements is None:
+            self._data[key] = deque((item,))
+        else:
             elements.append(item)
 
     def pop(self) -> 'Tuple[K, deque[V]]':
@@ -2,7 +2,7 @@ from contextlib import ExitStack
 
 from typing import Coroutine, Generator, Any as AnyT
 
-from .._core.loop import Hibernate, Interrupt as CoreInterrupt
+from .._core.loop import __HIBERNATE__, Interrupt as CoreInterrupt
 
 from .notification import Notification, postpone
 from .._core.handler import __USIM_STATE__
@@ -107,20 +107,25 @@ class Connective(Condition):
         self._children = conditions
 
     def __await__(self) -> Generator[AnyT, None, bool]:
-        return (yield from self.__await_children__().__await__())  # noqa: B901
-
-    async def __await_children__(self) -> bool:
-        await postpone()
+        yield from postpone().__await__()
         while not self:
-            with ExitStack() as stack:
-                for child in self._children:
-                    # we only need to wait for children which
-                    # are not True yet
-                    if child:
-                        continue
-                    stack.enter_context(child.__subscription__())
-                await Hibernate()  # hibernate until a child condition triggers
-        return True
+            # we only need to wait for children which are not True yet
+            pending = [child for child in self._children if not child]
+            # skip the ExitStack bookkeeping for the common, small cases
+            if len(pending) == 1:
+                with pending[0].__subscription__():
+                    yield from __HIBERNATE__
+            elif len(pending) == 2:
+                with pending[0].__subscription__(), \
+                        pending[1].__subscription__():
+                    yield from __HIBERNATE__
+            else:
+                with ExitStack() as stack:
+                    for child in pending:
+                        stack.enter_context(child.__subscription__())
+                    # hibernate until a child condition triggers
+                    yield from __HIBERNATE__
+        return True  # noqa: B901
 
     def __repr__(self):
         return f'{self.__class__.__name__}({", ".join(map(repr, self._children))})'
@@ -177,19 +177,19 @@ class Scope:
             raise ScopeClosed(self)
         assert after is None or at is None,\
             "start date must be either absolute or relative"
+        loop = __USIM_STATE__.loop
         # resolve "now" to what the event loop expects
         if after == 0:
             after = None
-        elif at == __USIM_STATE__.loop.time:
+        elif at == loop.time:
             at = None
         assert after is None or after > 0,\
             "start date must not be in the past"
-        assert at is None or at > __USIM_STATE__.loop.time,\
+        assert at is None or at > loop.time,\
             "start date must not be in the past"
+        # dates are passed on as-is, the loop handles absolute dates natively
         child_task = Task(payload, self, delay=after, at=at, volatile=volatile)
-        __USIM_STATE__.loop.schedule(
-            child_task.__runner__,
-        )
+        loop.schedule(child_task.__runner__)
         if not volatile:
             self._children.append(child_task)
         else:
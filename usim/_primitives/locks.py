@@ -1,7 +1,7 @@
 from typing import Coroutine
 
 from .._core.handler import __USIM_STATE__
-from .notification import Notification, NoSubscribers
+from .notification import Notification
 
 
 class Lock:
@@ -64,26 +64,25 @@ class Lock:
                 await self._notification
             except BaseException:
                 # we are the designated owner, pass on ownership
-                if self._owner == current_activity:
+                if self._owner is current_activity:
                     self.__release__()
                 raise
         self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        assert exc_type is GeneratorExit or self._owner == __USIM_STATE__.loop.activity
+        assert exc_type is GeneratorExit or self._owner is __USIM_STATE__.loop.activity
         self._depth -= 1
         if self._depth == 0:
             self.__release__()
         return False
 
     def __release__(self):
-        try:
-            candidate, signal = self._notification.__awake_next__()
-        except NoSubscribers:
+        # avoid raising NoSubscribers for the common, uncontested release
+        if not self._notification.__has_subscribers__():
             self._owner = None
         else:
-            self._owner = candidate
+            self._owner, _ = self._notification.__awake_next__()
 
     def __repr__(self):
         return f'<{self.__class__.__name__}, owner={self._owner!r}, '\
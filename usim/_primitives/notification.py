@@ -1,4 +1,5 @@
-from typing import List, Tuple, Coroutine, Optional
+from typing import Tuple, Coroutine, Optional
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from .._core.loop import Interrupt, __HIBERNATE__
@@ -12,6 +13,16 @@ class NoSubscribers(Exception):
     ...
 
 
+def _check_break_point(task, loop):
+    """
+    Check that a foreign interrupt is raised in the hibernating ``task``
+
+    Every hibernating primitive must re-raise any interrupt other than
+    its own wake up; this is the common sanity check before doing so.
+    """
+    assert task is loop.activity, 'Break points cannot be passed to other coroutines'
+
+
 async def postpone():
     """
     Postpone a coroutine in the current time step
@@ -23,16 +34,18 @@ async def postpone():
     task = loop.activity
     wake_up = Interrupt('postpone', task)
     loop.schedule(task, signal=wake_up)
+    consumed = False
     try:
         await __HIBERNATE__
     except Interrupt as err:
         if err is not wake_up:
-            assert (
-                task is loop.activity
-            ), 'Break points cannot be passed to other coroutines'
+            _check_break_point(task, loop)
             raise
+        consumed = True
     finally:
-        wake_up.revoke()
+        # being woken up by ``wake_up`` consumes it, there is nothing to revoke
+        if not consumed:
+            wake_up.revoke()
 
 
 async def suspend(*, delay: Optional[float], until: Optional[float]):
@@ -48,16 +61,18 @@ async def suspend(*, delay: Optional[float], until: Optional[float]):
     task = loop.activity
     wake_up = Interrupt('postpone', task)
     loop.schedule(task, signal=wake_up, delay=delay, at=until)
+    consumed = False
     try:
         await __HIBERNATE__
     except Interrupt as err:
         if err is not wake_up:
-            assert (
-                task is loop.activity
-            ), 'Break points cannot be passed to other coroutines'
+            _check_break_point(task, loop)
             raise
+        consumed = True
     finally:
-        wake_up.revoke()
+        # being woken up by ``wake_up`` consumes it, there is nothing to revoke
+        if not consumed:
+            wake_up.revoke()
 
 
 class Notification:
@@ -74,41 +89,63 @@ class Notification:
     __slots__ = ('_waiting',)
 
     def __init__(self):
-        self._waiting = []  # type: List[Tuple[Coroutine, Interrupt]]
+        # waiters are keyed by their unique wake up interrupt, which allows
+        # to unsubscribe in O(1) while preserving the subscription order
+        self._waiting = OrderedDict()  # type: OrderedDict[Interrupt, Coroutine]
 
     def __await__(self):
-        with self.__subscription__():
+        # inlined ``with self.__subscription__():`` - a plain await does
+        # not need a generator-based context manager for its bookkeeping
+        loop = __USIM_STATE__.loop
+        task = loop.activity
+        wake_up = Interrupt(self, task)
+        self.__subscribe__(task, wake_up)
+        try:
             yield from __HIBERNATE__
+        except Interrupt as err:
+            if err is not wake_up:
+                _check_break_point(task, loop)
+                raise
+        finally:
+            self.__unsubscribe__(task, wake_up)
 
     def __awake_next__(self) -> Tuple[Coroutine, Interrupt]:
         """Awake the oldest waiter"""
         try:
-            waiter, interrupt = self._waiting.pop(0)
-        except IndexError:
+            interrupt, waiter = self._waiting.popitem(last=False)
+        except KeyError:
             raise NoSubscribers
         else:
             __USIM_STATE__.loop.schedule(waiter, signal=interrupt)
             return waiter, interrupt
 
-    def __awake_all__(self) -> List[Tuple[Coroutine, Interrupt]]:
+    def __awake_all__(self) -> None:
         """Awake all waiters"""
-        awoken = self._waiting.copy()
-        self._waiting.clear()
-        for waiter, interrupt in awoken:
-            __USIM_STATE__.loop.schedule(waiter, signal=interrupt)
-        return awoken
+        waiting = self._waiting
+        # triggering without waiters is valid even outside a simulation
+        if not waiting:
+            return
+        # take over all waiters at once instead of copying and clearing them
+        self._waiting = OrderedDict()
+        schedule = __USIM_STATE__.loop.schedule
+        for interrupt, waiter in waiting.items():
+            schedule(waiter, signal=interrupt)
+
+    def __has_subscribers__(self) -> bool:
+        """Whether any task is waiting for this notification"""
+        return bool(self._waiting)
 
     # Subscribe/Unsubscribe
     def __subscribe__(self, waiter: Coroutine, interrupt: Interrupt):
         """Subscribe a task to this notification"""
-        self._waiting.append((waiter, interrupt))
+        self._waiting[interrupt] = waiter
 
     def __unsubscribe__(self, waiter: Coroutine, interrupt: Interrupt):
         """Unsubscribe a subscribed task"""
         if interrupt.scheduled:
             interrupt.revoke()
         else:
-            self._waiting.remove((waiter, interrupt))
+            del self._waiting[interrupt]
 
     @contextmanager
     def __subscription__(self):
@@ -120,9 +157,7 @@ class Notification:
             yield
         except Interrupt as err:
             if err is not wake_up:
-                assert (
-                    task is loop.activity
-                ), 'Break points cannot be passed to other coroutines'
+                _check_break_point(task, loop)
                 raise
         finally:
             self.__unsubscribe__(task, wake_up)
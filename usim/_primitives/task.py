@@ -1,7 +1,6 @@
-from functools import wraps
 import reprlib
 import enum
-from typing import Coroutine, TypeVar, Awaitable, Optional, Tuple, Any, List,\
+from typing import Coroutine, TypeVar, Awaitable, Optional, Any, List,\
     TYPE_CHECKING
 
 from .._core.loop import Interrupt
@@ -106,77 +105,90 @@ class Task(Awaitable[RT]):
     :note: This class should not be instantiated directly.
            Always use a :py:class:`~.Scope` to create it.
     """
-    __slots__ = 'payload', '_result', '__runner__', '_cancellations', '_done',\
-                '__volatile__', 'parent'
+    __slots__ = 'payload', '_finished', '_value', '_error', '__runner__',\
+                '_cancellations', '_done', '__volatile__', 'parent'
 
     def __init__(
             self,
             payload: Coroutine[Any, Any, RT], parent: 'Scope',
             delay: Optional[float], at: Optional[float], volatile: bool,
     ):
-        @wraps(payload)
-        async def payload_wrapper():
-            # check for a pre-run cancellation
-            if self._result is not None:
-                try_close(self.payload)
-                self.parent.__child_finished__(self, failed=False)
-                return
-            try:
-                # We suspend the Task internally instead of waiting to start
-                # the Task externally. This is because starting must *always*
-                # be done via ``Task.__runner__.send(None)`` which we *cannot*
-                # cancel cleanly. An internal suspension means we *can* cancel
-                # the Task pre-run because no time passes until we check that.
-                if delay or at:
-                    await suspend(delay=delay, until=at)
-                result = await self.payload
-            except CancelTask as err:
-                assert (
-                    err.subject is self
-                ), "task for activity %r received cancellation of %r" % (
-                    self, err.subject
-                )
-                self._result = None, err.__transcript__
-                self.parent.__child_finished__(self, failed=False)
-            except GeneratorExit:
-                # We are NOT allowed to do any async once the generator
-                # exits forcefully.
-                # We should only receive GeneratorExit due to a forceful
-                # termination in self.__close__ or during cleanup.
-                self.parent.__child_finished__(self, failed=False)
-            except BaseException as err:
-                self._result = None, err
-                self.parent.__child_finished__(self, failed=True)
-            else:
-                self._result = result, None
-                self.parent.__child_finished__(self, failed=False)
-            for cancellation in self._cancellations:
-                cancellation.revoke()
-            try_close(self.payload)
-            self._done.__set_done__()
         self.__volatile__ = volatile
         self._cancellations = []  # type: List[CancelTask]
-        self._result = None  \
-            # type: Optional[Tuple[Optional[RT], Optional[BaseException]]]
+        # the outcome is stored as separate fields instead of a tuple,
+        # since ``None`` is a valid result we need an explicit flag
+        self._finished = False
+        self._value = None  # type: Optional[RT]
+        self._error = None  # type: Optional[BaseException]
         self.payload = payload
         self.parent = parent
         self._done = Done(self)
-        self.__runner__ = payload_wrapper()  # type: Coroutine[Any, Any, RT]
+        runner = self._run_payload(delay, at)
+        # mimic the payload to keep reprs and tracebacks meaningful
+        try:
+            runner.__name__ = payload.__name__
+            runner.__qualname__ = payload.__qualname__
+        except AttributeError:
+            pass
+        self.__runner__ = runner  # type: Coroutine[Any, Any, RT]
+
+    async def _run_payload(self, delay: Optional[float], at: Optional[float]):
+        # check for a pre-run cancellation
+        if self._finished:
+            try_close(self.payload)
+            self.parent.__child_finished__(self, failed=False)
+            return
+        failed = False
+        try:
+            # We suspend the Task internally instead of waiting to start
+            # the Task externally. This is because starting must *always*
+            # be done via ``Task.__runner__.send(None)`` which we *cannot*
+            # cancel cleanly. An internal suspension means we *can* cancel
+            # the Task pre-run because no time passes until we check that.
+            if delay or at:
+                await suspend(delay=delay, until=at)
+            result = await self.payload
+        except CancelTask as err:
+            assert (
+                err.subject is self
+            ), "task for activity %r received cancellation of %r" % (
+                self, err.subject
+            )
+            self._finished = True
+            self._error = err.__transcript__
+        except GeneratorExit:
+            # We are NOT allowed to do any async once the generator
+            # exits forcefully.
+            # We should only receive GeneratorExit due to a forceful
+            # termination in self.__close__ or during cleanup.
+            pass
+        except BaseException as err:
+            self._finished = True
+            self._error = err
+            failed = True
+        else:
+            self._finished = True
+            self._value = result
+        self.parent.__child_finished__(self, failed=failed)
+        for cancellation in self._cancellations:
+            cancellation.revoke()
+        try_close(self.payload)
+        self._done.__set_done__()
 
     def __await__(self):
         yield from self._done.__await__()
-        result, error = self._result
+        error = self._error
         if error is not None:
             raise error
         else:
-            return result  # noqa: B901
+            return self._value  # noqa: B901
 
     @property
     def __exception__(self) -> Optional[BaseException]:
         """Get the exception of this task"""
-        assert self._result is not None,\
+        assert self._finished,\
             'Task.__exception__ may only be queried for finished tasks'
-        return self._result[1]
+        return self._error
 
     @property
     def done(self) -> 'Done':
@@ -189,8 +201,8 @@ class Task(Awaitable[RT]):
     @property
     def status(self) -> TaskState:
         """The current status of this activity"""
-        if self._result is not None:
-            result, error = self._result
+        if self._finished:
+            error = self._error
             if error is not None:
                 return (
                     TaskState.CANCELLED
@@ -211,8 +223,9 @@ class Task(Awaitable[RT]):
         but ensures that waiting activities are properly notified.
         """
         # we have not FINISHED running yet, and can still change the result
-        if self._result is None:
-            self._result = None, reason
+        if not self._finished:
+            self._finished = True
+            self._error = reason
             if self.__runner__.cr_frame.f_lasti == -1:
                 # We have not STARTED running yet
                 # This means __runner__ will start running in the same time frame.
@@ -246,9 +259,10 @@ class Task(Awaitable[RT]):
         :warning: The timing of cancelling a Task before it started running
                   may change in the future.
         """
-        if self._result is None:
+        if not self._finished:
             if self.status is TaskState.CREATED:
-                self._result = None, TaskCancelled(self, *token)
+                self._finished = True
+                self._error = TaskCancelled(self, *token)
                 self._done.__set_done__()
             else:
                 cancellation = CancelTask(self, *token)
@@ -258,10 +272,10 @@ class Task(Awaitable[RT]):
 
     @reprlib.recursive_repr()
     def __repr__(self):
-        child_status = 'active' if self._result is None else (
-            f'result={self._result[0]!r}'
-            if self._result[1] is None else
-            f'signal={self._result[1]!r}'
+        child_status = 'active' if not self._finished else (
+            f'result={self._value!r}'
+            if self._error is None else
+            f'signal={self._error!r}'
         )
         return (
             f'<{self.__class__.__name__} object payload={self.payload}[{child_status}] '
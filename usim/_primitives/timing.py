@@ -60,7 +60,7 @@ class After(Condition):
         # we will *always* wake up once the target has passed
         # either we wake up in the same time frame,
         # or just wait for a single trigger
-        if self:
+        if __USIM_STATE__.loop.time >= self.date:
             yield from postpone().__await__()
             return True
         self._ensure_trigger()
@@ -108,7 +108,7 @@ class Before(Condition):
         # we will *never* wake up once the target has passed
         # either we wake up in the same time frame,
         # or just hibernate indefinitely
-        if self:
+        if __USIM_STATE__.loop.time < self.date:
             yield from postpone().__await__()
         else:
             yield from __HIBERNATE__
@@ -121,7 +121,7 @@ class Before(Condition):
         return f'usim.time < {self.date}'
 
 
-class Moment(Condition):
+class Moment(After):
     r"""
     A certain point in time
 
@@ -136,13 +136,9 @@ class Moment(Condition):
 
     The expression ``time == target`` is equivalent to ``Moment(target)``.
     """
-    __slots__ = ('date', '_transition')
-
-    def __init__(self, date: float):
-        super().__init__()
-        self.date = date
-        # notification point at which we transition from before to after
-        self._transition = After(date)
+    # A moment is notified exactly when transitioning from before to after.
+    # Reusing the trigger of ``After`` avoids wrapping a separate instance.
+    __slots__ = ()
 
     def __bool__(self):
         return __USIM_STATE__.loop.time == self.date
@@ -159,22 +155,21 @@ class Moment(Condition):
         # we will *never* wake up once the target has passed
         # either we wake up in the same time frame,
         # or just hibernate indefinitely
-        if __USIM_STATE__.loop.time == self.date:
+        now = __USIM_STATE__.loop.time
+        if now == self.date:
             yield from postpone().__await__()
-        elif not self._transition:
-            yield from self._transition.__await__()
+        elif now < self.date:
+            yield from After.__await__(self)
         else:
             yield from __HIBERNATE__
         return True  # noqa: B901
 
     def __subscribe__(self, waiter: Coroutine, interrupt: CoreInterrupt):
-        self._transition.__subscribe__(waiter, interrupt)
-
-    def __unsubscribe__(self, waiter: Coroutine, interrupt: CoreInterrupt):
-        self._transition.__unsubscribe__(waiter, interrupt)
-
-    def __repr__(self):
-        return f'{self.__class__.__name__}(date={self.date})'
+        # a moment that has passed never triggers again - there is no
+        # point in time at which we could still schedule the trigger
+        if __USIM_STATE__.loop.time < self.date:
+            self._ensure_trigger()
+        Condition.__subscribe__(self, waiter, interrupt)
 
     def __str__(self):
         return f'usim.time == {self.date}'
@@ -199,7 +194,7 @@ class Eternity(Condition):
         return False
 
     def __invert__(self):
-        return Instant()
+        return instant
 
     def __await__(self) -> Generator[Any, None, bool]:
         yield from __HIBERNATE__
@@ -230,7 +225,7 @@ class Instant(Condition):
         return True
 
     def __invert__(self):
-        return Eternity()
+        return eternity
 
     def __await__(self) -> Generator[Any, None, bool]:
         yield from postpone().__await__()
@@ -276,6 +271,11 @@ class Delay(Notification):
         super().__init__()
         self.duration = duration
 
+    def __await__(self) -> Generator[Any, None, None]:
+        # A plain ``await`` does not need the subscription bookkeeping of
+        # Notification: we are the only waiter and just schedule ourselves.
+        yield from suspend(delay=self.duration, until=None).__await__()
+
     def __subscribe__(self, waiter: Coroutine, interrupt: CoreInterrupt):
         interrupt.scheduled = True
         __USIM_STATE__.loop.schedule(waiter, interrupt, delay=self.duration)
@@ -391,7 +391,7 @@ class Time:
     def __add__(self, other: float) -> Union[Delay, Instant]:
         assert other >= 0, "delay must point at the future"
         if other == 0:
-            return Instant()
+            return instant
         return Delay(other)
 
     def __ge__(self, other: float) -> After:
@@ -455,7 +455,11 @@ class Time:
             return f'<attached handle usim.time @ {now}>'
 
 
+# Time related singletons, exported as ``usim.time``, ``usim.eternity``
+# and ``usim.instant`` - none of them ever holds any waiters
 time = Time()
+eternity = Eternity()
+instant = Instant()
 
 
 class IntervalExceeded(Exception):
@@ -492,16 +496,20 @@ async def interval(period) -> AsyncIterable[float]:
     """
     if period < 0:
         raise ValueError('period must not be negative')
-    last_time = time.now
+    # the loop cannot change while we are iterating inside of it
+    loop = __USIM_STATE__.loop
+    last_time = loop.time
     while True:
-        remaining_delay = last_time + period - time.now
-        if remaining_delay < 0:
+        # resume at the absolute date instead of translating it to a delay
+        next_time = last_time + period
+        now = loop.time
+        if next_time < now:
             raise IntervalExceeded()
-        elif remaining_delay > 0:
-            await suspend(delay=remaining_delay, until=None)
+        elif next_time > now:
+            await suspend(delay=None, until=next_time)
         else:
             await postpone()
-        last_time = time.now
+        last_time = loop.time
         yield last_time
 
 
@@ -530,11 +538,12 @@ async def delay(period) -> AsyncIterable[float]:
     """
     if period < 0:
         raise ValueError('period must not be negative')
+    loop = __USIM_STATE__.loop
     if period > 0:
         while True:
             await suspend(delay=period, until=None)
-            yield time.now
+            yield loop.time
     else:
         while True:
             await postpone()
-            yield time.now
+            yield loop.time
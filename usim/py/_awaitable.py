@@ -19,6 +19,8 @@ class AwaitableEvent(Generic[R]):
     **this is a bug**; please report it in our
     `Issue Tracker <https://github.com/MaineKuehn/usim/issues>`_.
     """
+    __slots__ = '_awaitable', '_value', 'defused'
+
     @property
     def value(self) -> R:
         try:
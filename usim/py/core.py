@@ -7,7 +7,7 @@ components of the simulation need access to the current environment
 An environment can be run standalone, or embedded into a μSim simulation.
 The latter allows interactions between the μSim and SimPy components.
 """
-from typing import Optional, List, Tuple, Coroutine, Generator, TypeVar, Iterable,\
+from typing import Optional, List, Coroutine, Generator, TypeVar, Iterable,\
     Union
 from .._core.handler import __USIM_STATE__, AbstractLoop
 from .. import time, run as usim_run, Concurrent
@@ -18,6 +18,8 @@ from .exceptions import NotCompatibleError, StopSimulation
 
 
 class EnvironmentScope(Scope):
+    __slots__ = ()
+
     def _is_suppressed(self, exc_val):
         return isinstance(exc_val, StopSimulation) or super()._is_suppressed(exc_val)
 
@@ -96,11 +98,14 @@ class Environment:
             Use the operators ``|`` ("any"), ``&`` ("all") or ``~`` ("not") to
             combine events, as in ``flag1 & flag2 | ~flag3``.
     """
-    __slots__ = '_initial_time', '_startup', '_loop', '_scope', 'active_process'
+    __slots__ = '_initial_time', '_startup_events', '_startup_delays', '_loop',\
+        '_scope', 'active_process'
 
     def __init__(self, initial_time=0):
         self._initial_time = initial_time
-        self._startup = []  # type: List[Tuple[Coroutine, float]]
+        # events scheduled before the loop starts, kept as parallel lists
+        self._startup_events = []  # type: List[Coroutine]
+        self._startup_delays = []  # type: List[Optional[float]]
         self._loop = None  # type: Optional[AbstractLoop]
         self._scope = EnvironmentScope()
         #: The currently active process
@@ -109,13 +114,15 @@ class Environment:
     async def __aenter__(self):
         if self._loop is not None:
             raise RuntimeError('%r is not re-entrant' % self.__class__.__name__)
-        self._loop = __USIM_STATE__.loop
+        loop = self._loop = __USIM_STATE__.loop
         await self._scope.__aenter__()
-        if self._loop.time < self._initial_time:
+        if loop.time < self._initial_time:
             await (time == self._initial_time)
-        for event, delay in self._startup:
-            self._schedule(event, delay)
-        self._startup.clear()
+        do = self._scope.do
+        for event, delay in zip(self._startup_events, self._startup_delays):
+            do(event, after=delay)
+        self._startup_events.clear()
+        self._startup_delays.clear()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -129,7 +136,7 @@ class Environment:
                     if isinstance(until, Event):
                         await until.__usimpy_flag__
                     else:
-                        if until < time.now:
+                        if until < self._loop.time:
                             raise ValueError('until must be in the future')
                         await (time >= until)
                     raise StopSimulation
@@ -189,7 +196,7 @@ class Environment:
         The μSim compatibility layer uses the regular μSim event loop.
         There is no public alternative to 'Environment.peek'.
         """
-        raise NotCompatibleError(self.step.__doc__)
+        raise NotCompatibleError(self.peek.__doc__)
 
     @property
     def now(self) -> float:
@@ -200,9 +207,10 @@ class Environment:
 
             Migrate by using :py:attr:`usim.time.now` instead.
         """
-        if self._loop is None:
+        loop = self._loop
+        if loop is None:
             return self._initial_time
-        return self._loop.time
+        return loop.time
 
     def schedule(self, event: 'Union[Event, Coroutine]', priority=1, delay=0):
         """
@@ -221,17 +229,15 @@ class Environment:
             raise NotCompatibleError('Only the default priority=1 is supported')
         if isinstance(event, Event):
             event = event.__usimpy_schedule__()
-        if delay == 0:
-            delay = None
+        # the scope expects None instead of 0 for "no delay"
+        delay = delay or None
         # We may get called before the loop has started.
         # Queue events until the loop starts.
         if self._loop is None:
-            self._startup.append((event, delay))
+            self._startup_events.append(event)
+            self._startup_delays.append(delay)
         else:
-            self._schedule(event, delay)
-
-    def _schedule(self, coroutine: Coroutine, delay):
-        self._scope.do(coroutine, after=delay)
+            self._scope.do(event, after=delay)
 
     def process(self, generator: Generator[Event, Event, V]) -> 'Process[V]':
         """
@@ -293,7 +299,7 @@ class Environment:
         # though the event loop is never run.
         # Clean up our internal callbacks to avoid resource
         # leak warnings.
-        for event, _ in self._startup:
+        for event in self._startup_events:
             event.close()
 
 
@@ -10,7 +10,7 @@ A native μSim simulation can react to events by having an :term:`activity`
 ``await`` an event.
 """
 from typing import TYPE_CHECKING, TypeVar, Generic, Union, Tuple, Optional, Generator,\
-    List, Iterable, Callable, Awaitable
+    List, Iterable, Callable, Awaitable, Coroutine
 from .. import Flag, time
 from .._primitives.condition import Any as AnyFlag
 
@@ -162,9 +162,10 @@ class Event(Generic[V]):
         if exception is not None and not self.defused:
             raise exception
 
-    async def __usimpy_schedule__(self):
+    def __usimpy_schedule__(self) -> Coroutine:
         """Coroutine to schedule this Event in ``usim.py``"""
-        await self._invoke_callbacks()
+        # hand out the callback coroutine itself instead of wrapping it
+        return self._invoke_callbacks()
 
     def _trigger(self):
         """Awake all waiting tasks and schedule the event itself"""
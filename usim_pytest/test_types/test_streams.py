@@ -1,4 +1,6 @@
+import gc
 import pytest
+import weakref
 from typing import Type
 
 from usim import time, Scope
@@ -97,3 +99,51 @@ class Test1to1Queue(Base1to1Stream):
 
 class Test1to1Channel(Base1to1Stream):
     stream_type = Channel
+
+    @via_usim
+    async def test_broadcast(self):
+        """Every consumer receives all messages since it started consuming"""
+        stream = self.stream_type()
+
+        async def fill(*values):
+            for value in values:
+                await stream.put(value)
+                await (time + 1)
+            await stream.close()
+
+        async def read(delay: float):
+            values = []
+            async for value in stream:
+                values.append(value)
+                await (time + delay)
+            return values
+
+        async with Scope() as scope:
+            fast = scope.do(read(0))
+            slow = scope.do(read(5))
+            late = scope.do(read(0), after=9.5)
+            scope.do(fill(*range(20)))
+        assert (await fast) == list(range(20))
+        assert (await slow) == list(range(20))
+        assert (await late) == list(range(10, 20))
+
+    @via_usim
+    async def test_unconsumed(self):
+        """Messages that nobody consumes are not kept alive"""
+        class Message:
+            pass
+
+        stream = self.stream_type()
+        message = Message()
+        reference = weakref.ref(message)
+        await stream.put(message)
+        del message
+        gc.collect()
+        assert reference() is None
+        message = Message()
+        reference = weakref.ref(message)
+        await stream.put(message)
+        await stream.close()
+        del message
+        gc.collect()
+        assert reference() is None
@@ -3,6 +3,7 @@ import math
 import pytest
 
 from usim import time, until, eternity, instant, delay, interval, IntervalExceeded
+from usim import Flag, Scope
 
 from ..utility import via_usim, assertion_mode
 
@@ -143,6 +144,32 @@ class TestTimeCondition:
         assert (time == start + 20)
         assert time.now == start + 20
 
+    @via_usim
+    async def test_passed_moment_until(self):
+        start = time.now
+        moment = time == start + 5
+        await moment
+        await (time + 5)
+        async with until(moment):
+            await (time + 3)  # a passed moment never interrupts
+        assert time.now == start + 13
+
+    @via_usim
+    async def test_passed_moment_any(self):
+        start = time.now
+        moment = time == start + 5
+        flag = Flag()
+
+        async def set_flag():
+            await (time + 3)
+            await flag.set()
+
+        await (time + 10)
+        async with Scope() as scope:
+            scope.do(set_flag())
+            await (flag | moment)  # a passed moment never triggers
+        assert time.now == start + 13
+
     @via_usim
     async def test_extremes(self):
         start = time.now
@@ -1,7 +1,7 @@
 import operator
 import pytest
 
-from usim import Scope, time
+from usim import Scope, time, until
 from usim import Tracked
 
 from ..utility import via_usim, assertion_mode
@@ -111,6 +111,30 @@ class TestTracked:
             await (tracked == value + 20)
         assert time.now == 20
 
+    @via_usim
+    async def test_comparison_subscription(self):
+        """Comparisons listen to changes only once they are waited on"""
+        left, right = Tracked(0), Tracked(10)
+        reached = left >= 10
+        crossed = left > right
+        # a comparison used only in a boolean context is never registered
+        assert not reached and not crossed
+        assert reached not in left._listeners
+        assert crossed not in left._listeners
+        assert crossed not in right._listeners
+        async with Scope() as scope:
+            scope.do(left + 10, after=5)
+            scope.do(left + 10, after=15)
+            async with until(reached):
+                assert reached in left._listeners
+                await (time + 20)
+            assert time.now == 5
+            assert crossed not in left._listeners
+            await (crossed | (time == 30))
+            assert time.now == 15
+            assert crossed in left._listeners
+            assert crossed in right._listeners
+
     @via_usim
     async def test_mutable(self):
         """Tracked does not mutate the initial value if operations are pure"""
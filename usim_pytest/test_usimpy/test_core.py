@@ -64,6 +64,12 @@ class TestEnvironment:
         with pytest.raises(NotCompatibleError):
             env.run()
 
+    def test_not_compatible(self, env):
+        with pytest.raises(NotCompatibleError, match='Environment.step'):
+            env.step()
+        with pytest.raises(NotCompatibleError, match='Environment.peek'):
+            env.peek()
+
     @via_usim
     async def test_no_duplication(self, env):
         async def run_env():